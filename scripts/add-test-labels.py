@@ -3,40 +3,42 @@
 Add human-readable labels to test cases
 """
 import json
+from functools import lru_cache
 from pathlib import Path
 
+# Common test ID patterns
+LABEL_MAP = {
+    'h1': 'Has <h1> heading',
+    'h2': 'Has <h2> heading',
+    'p': 'Has paragraph',
+    'ul': 'Has unordered list',
+    'ol': 'Has ordered list',
+    'li3': 'Has 3+ list items',
+    'a': 'Has link element',
+    'blank': 'Opens in new tab',
+    'img': 'Has image with alt',
+    'table': 'Has table element',
+    'form': 'Has form element',
+    'input': 'Has input field',
+    'button': 'Has button',
+    'div': 'Has div container',
+    'span': 'Has span element',
+    'nav': 'Has navigation',
+    'header': 'Has header',
+    'footer': 'Has footer',
+    'section': 'Has section',
+    'article': 'Has article',
+    'hello': 'Renders correctly',
+    'sample': 'Basic test passes',
+}
+
+@lru_cache(maxsize=None)
 def generate_test_label(test_id, test_code):
     """Generate a human-readable label for a test"""
 
-    # Common test ID patterns
-    label_map = {
-        'h1': 'Has <h1> heading',
-        'h2': 'Has <h2> heading',
-        'p': 'Has paragraph',
-        'ul': 'Has unordered list',
-        'ol': 'Has ordered list',
-        'li3': 'Has 3+ list items',
-        'a': 'Has link element',
-        'blank': 'Opens in new tab',
-        'img': 'Has image with alt',
-        'table': 'Has table element',
-        'form': 'Has form element',
-        'input': 'Has input field',
-        'button': 'Has button',
-        'div': 'Has div container',
-        'span': 'Has span element',
-        'nav': 'Has navigation',
-        'header': 'Has header',
-        'footer': 'Has footer',
-        'section': 'Has section',
-        'article': 'Has article',
-        'hello': 'Renders correctly',
-        'sample': 'Basic test passes',
-    }
-
     # Check if we have a direct mapping
-    if test_id in label_map:
-        return label_map[test_id]
+    if test_id in LABEL_MAP:
+        return LABEL_MAP[test_id]
 
     # Parse from code
     if "querySelector('h1')" in test_code:
@@ -83,6 +85,14 @@ def generate_test_label(test_id, test_code):
     # Fallback - capitalize test ID
     return test_id.replace('_', ' ').replace('-', ' ').title()
 
+def add_labels(tasks):
+    """Add a label to every test that does not have one yet"""
+    for task in tasks:
+        for test in task['tests']:
+            if 'label' not in test:
+                test['label'] = generate_test_label(test['id'], test['code'])
+    return tasks
+
 def main():
     # Load tasks
     tasks_path = Path(__file__).parent.parent / 'apps' / 'web' / 'data' / 'tasks.levels.json'
@@ -93,10 +103,7 @@ def main():
     print(f"Adding labels to tests in {len(tasks)} tasks...")
 
     # Add labels to tests
-    for task in tasks:
-        for test in task['tests']:
-            if 'label' not in test:
-                test['label'] = generate_test_label(test['id'], test['code'])
+    add_labels(tasks)
 
     # Show examples
     print("\nExamples:")
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Analyze requirement coverage and difficulty balance across the task catalogue
+
+Runs the same rules as generate-descriptions.py and add-test-labels.py once
+per test, stores the results as NumPy task-by-rule matrices and computes every
+aggregate (coverage, co-occurrence, gaps, outliers) on those arrays.
+
+Usage:
+    python3 scripts/analyze-catalogue.py
+    python3 scripts/analyze-catalogue.py --json report.json
+    python3 scripts/analyze-catalogue.py --synthetic 1000000
+"""
+import argparse
+import ast
+import importlib.util
+import inspect
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPTS_DIR = Path(__file__).parent
+TASKS_PATH = SCRIPTS_DIR.parent / 'apps' / 'web' / 'data' / 'tasks.levels.json'
+
+# Column used for any rule output that is not a fixed string (f-string or title-cased id)
+FALLBACK = '(fallback)'
+
+# Rows per block when computing the co-occurrence product in float32
+CHUNK_ROWS = 1 << 16
+
+
+def load_script(filename):
+    """Import one of the hyphenated sibling scripts as a module"""
+    path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def rule_outputs(func, table=()):
+    """List every fixed string a rule function (and its lookup table) can return"""
+    tree = ast.parse(inspect.getsource(func))
+    outputs = list(table)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Return) and isinstance(node.value, ast.Constant):
+            outputs.append(node.value.value)
+        elif isinstance(node, ast.Dict):
+            outputs.extend(v.value for v in node.values if isinstance(v, ast.Constant))
+
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(o for o in outputs if isinstance(o, str))) + [FALLBACK]
+
+
+def synthetic_catalogue(tasks, size, seed=0):
+    """Build a catalogue of `size` tasks by resampling tests from real ones"""
+    rng = np.random.default_rng(seed)
+    pool = [test for task in tasks for test in task['tests']]
+    categories = sorted({task['category'] for task in tasks})
+
+    n_tests = rng.integers(1, 6, size=size)
+    test_idx = rng.integers(0, len(pool), size=int(n_tests.sum())).tolist()
+    cat_idx = rng.integers(0, len(categories), size=size).tolist()
+    difficulty = rng.integers(1, 6, size=size).tolist()
+    bounds = np.concatenate(([0], np.cumsum(n_tests))).tolist()
+
+    return [
+        {
+            'id': f'synthetic-{i:07d}',
+            'category': categories[cat_idx[i]],
+            'difficulty': difficulty[i],
+            'tests': [pool[j] for j in test_idx[bounds[i]:bounds[i + 1]]],
+        }
+        for i in range(size)
+    ]
+
+
+def build_matrices(tasks, analyze, label, req_names, label_names):
+    """Apply the rules once per test and return the catalogue as arrays"""
+    req_col = {name: i for i, name in enumerate(req_names)}
+    label_col = {name: i for i, name in enumerate(label_names)}
+    req_fallback = req_col[FALLBACK]
+    label_fallback = label_col[FALLBACK]
+
+    # Rules are pure functions of (code, id), so each distinct test is evaluated once
+    cache = {}
+    req_rows, req_cols, label_rows, label_cols = [], [], [], []
+    categories = {}
+    cat_codes = np.empty(len(tasks), dtype=np.int32)
+    difficulty = np.empty(len(tasks), dtype=np.int16)
+
+    for row, task in enumerate(tasks):
+        cat_codes[row] = categories.setdefault(task.get('category', ''), len(categories))
+        difficulty[row] = task.get('difficulty', 0)
+        for test in task['tests']:
+            key = (test['code'], test['id'])
+            cols = cache.get(key)
+            if cols is None:
+                cols = cache[key] = (
+                    req_col.get(analyze(test['code'], test['id']), req_fallback),
+                    label_col.get(label(test['id'], test['code']), label_fallback),
+                )
+            req_rows.append(row)
+            req_cols.append(cols[0])
+            label_rows.append(row)
+            label_cols.append(cols[1])
+
+    requirements = np.zeros((len(tasks), len(req_names)), dtype=bool)
+    requirements[req_rows, req_cols] = True
+    labels = np.zeros((len(tasks), len(label_names)), dtype=bool)
+    labels[label_rows, label_cols] = True
+
+    return {
+        'ids': [task['id'] for task in tasks],
+        'requirements': requirements,
+        'labels': labels,
+        'difficulty': difficulty,
+        'category_codes': cat_codes,
+        'category_names': list(categories),
+    }
+
+
+def crosstab(matrix, group_codes, n_groups):
+    """Count tasks per (group, column) for a boolean task-by-column matrix"""
+    rows, cols = np.nonzero(matrix)
+    n_cols = matrix.shape[1]
+    counts = np.bincount(group_codes[rows] * n_cols + cols, minlength=n_groups * n_cols)
+    return counts.reshape(n_groups, n_cols)
+
+
+def cooccurrence(matrix):
+    """Count tasks sharing each pair of columns (float32 BLAS is exact below 2**24 rows per chunk)"""
+    n_cols = matrix.shape[1]
+    total = np.zeros((n_cols, n_cols), dtype=np.int64)
+    for start in range(0, matrix.shape[0], CHUNK_ROWS):
+        block = matrix[start:start + CHUNK_ROWS].astype(np.float32)
+        total += np.rint(block.T @ block).astype(np.int64)
+    return total
+
+
+def summarize(data, req_names, label_names, top=10, z_threshold=3.0):
+    """Compute coverage, co-occurrence, gaps and outliers from the arrays"""
+    requirements = data['requirements']
+    labels = data['labels']
+    cat_names = data['category_names']
+    cat_codes = data['category_codes']
+    levels, level_codes = np.unique(data['difficulty'], return_inverse=True)
+    n_tasks = requirements.shape[0]
+
+    req_coverage = requirements.sum(axis=0)
+    label_coverage = labels.sum(axis=0)
+    req_by_level = crosstab(requirements, level_codes, len(levels))
+    req_by_cat = crosstab(requirements, cat_codes, len(cat_names))
+    cat_by_level = np.bincount(
+        cat_codes * len(levels) + level_codes, minlength=len(cat_names) * len(levels)
+    ).reshape(len(cat_names), len(levels))
+
+    # Gaps: rules that never fire, and concepts present in the catalogue but absent at some level
+    used = req_coverage > 0
+    req_gap_r, req_gap_l = np.nonzero((req_by_level.T == 0) & used[:, None])
+    cat_gap_c, cat_gap_l = np.nonzero(cat_by_level == 0)
+
+    # Co-occurrence: most frequent requirement pairs (upper triangle, excluding diagonal)
+    pairs = cooccurrence(requirements)
+    upper_r, upper_c = np.triu_indices(len(req_names), k=1)
+    pair_counts = pairs[upper_r, upper_c]
+    union = req_coverage[upper_r] + req_coverage[upper_c] - pair_counts
+    jaccard = np.divide(pair_counts, union, out=np.zeros(len(pair_counts)), where=union > 0)
+    order = np.argsort(-pair_counts, kind='stable')[:top]
+    order = order[pair_counts[order] > 0]
+
+    # Outliers: requirement count far from the mean of tasks at the same difficulty
+    n_reqs = requirements.sum(axis=1)
+    per_level = np.bincount(level_codes, minlength=len(levels))
+    mean = np.bincount(level_codes, weights=n_reqs) / per_level
+    var = np.bincount(level_codes, weights=n_reqs.astype(np.float64) ** 2) / per_level - mean ** 2
+    std = np.sqrt(np.maximum(var, 0.0))
+    z = np.divide(
+        n_reqs - mean[level_codes], std[level_codes],
+        out=np.zeros(n_tasks), where=std[level_codes] > 0,
+    )
+    outliers = np.flatnonzero(np.abs(z) > z_threshold)
+    outliers = outliers[np.argsort(-np.abs(z[outliers]), kind='stable')]
+
+    return {
+        'tasks': int(n_tasks),
+        'difficulty_levels': levels.tolist(),
+        'requirement_coverage': {
+            name: int(count) for name, count in zip(req_names, req_coverage)
+        },
+        'label_coverage': {
+            name: int(count) for name, count in zip(label_names, label_coverage)
+        },
+        'requirements_by_difficulty': {
+            name: dict(zip(levels.tolist(), req_by_level[:, i].tolist()))
+            for i, name in enumerate(req_names) if used[i]
+        },
+        'requirements_by_category': {
+            cat: {req_names[i]: int(n) for i, n in enumerate(row) if n}
+            for cat, row in zip(cat_names, req_by_cat)
+        },
+        'category_by_difficulty': {
+            cat: dict(zip(levels.tolist(), row.tolist()))
+            for cat, row in zip(cat_names, cat_by_level)
+        },
+        'unused_requirements': [name for name, n in zip(req_names, req_coverage) if not n],
+        'unused_labels': [name for name, n in zip(label_names, label_coverage) if not n],
+        'requirement_difficulty_gaps': [
+            {'requirement': req_names[r], 'difficulty': int(levels[l])}
+            for r, l in zip(req_gap_r, req_gap_l)
+        ],
+        'category_difficulty_gaps': [
+            {'category': cat_names[c], 'difficulty': int(levels[l])}
+            for c, l in zip(cat_gap_c, cat_gap_l)
+        ],
+        'top_cooccurring_requirements': [
+            {
+                'pair': [req_names[upper_r[i]], req_names[upper_c[i]]],
+                'tasks': int(pair_counts[i]),
+                'jaccard': round(float(jaccard[i]), 3),
+            }
+            for i in order
+        ],
+        'outliers': [
+            {
+                'id': data['ids'][i],
+                'difficulty': int(data['difficulty'][i]),
+                'requirements': int(n_reqs[i]),
+                'z': round(float(z[i]), 2),
+            }
+            for i in outliers[:top]
+        ],
+        'outlier_count': int(len(outliers)),
+    }
+
+
+def print_report(report, top=10):
+    """Print a readable summary of the analytics report"""
+    print(f"\nCatalogue: {report['tasks']} tasks, difficulty levels {report['difficulty_levels']}")
+
+    print("\nRequirement coverage (tasks):")
+    coverage = sorted(report['requirement_coverage'].items(), key=lambda kv: -kv[1])
+    for name, count in coverage[:top]:
+        print(f"  {count:>8}  {name}")
+
+    print(f"\nRequirement rules that never fire ({len(report['unused_requirements'])}):")
+    for name in report['unused_requirements']:
+        print(f"  - {name}")
+
+    print(f"\nLabel rules that never fire ({len(report['unused_labels'])}):")
+    for name in report['unused_labels']:
+        print(f"  - {name}")
+
+    print(f"\nRequirements missing at a difficulty level ({len(report['requirement_difficulty_gaps'])}):")
+    for gap in report['requirement_difficulty_gaps'][:top]:
+        print(f"  - {gap['requirement']} (difficulty {gap['difficulty']})")
+
+    print(f"\nCategories missing at a difficulty level ({len(report['category_difficulty_gaps'])}):")
+    for gap in report['category_difficulty_gaps'][:top]:
+        print(f"  - {gap['category']} (difficulty {gap['difficulty']})")
+
+    print("\nMost common requirement pairs:")
+    for pair in report['top_cooccurring_requirements']:
+        print(f"  {pair['tasks']:>8}  {pair['pair'][0]} + {pair['pair'][1]} (jaccard {pair['jaccard']})")
+
+    print(f"\nOutliers by requirement count ({report['outlier_count']}):")
+    for task in report['outliers']:
+        print(f"  {task['id']}: {task['requirements']} requirements at difficulty {task['difficulty']} (z={task['z']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=Path, default=TASKS_PATH, help='tasks JSON file')
+    parser.add_argument('--json', type=Path, help='write the full report to this file')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='analyze N tasks resampled from the catalogue instead')
+    parser.add_argument('--seed', type=int, default=0, help='seed for --synthetic')
+    parser.add_argument('--top', type=int, default=10, help='rows to show per section')
+    args = parser.parse_args()
+
+    descriptions = load_script('generate-descriptions.py')
+    test_labels = load_script('add-test-labels.py')
+    req_names = rule_outputs(descriptions.analyze_test_code)
+    label_names = rule_outputs(test_labels.generate_test_label, test_labels.LABEL_MAP.values())
+
+    # Load tasks
+    with open(args.tasks, 'r') as f:
+        tasks = json.load(f)
+
+    if args.synthetic:
+        start = time.perf_counter()
+        tasks = synthetic_catalogue(tasks, args.synthetic, args.seed)
+        print(f"Built {len(tasks)} synthetic tasks in {time.perf_counter() - start:.2f}s")
+
+    print(f"Analyzing {len(tasks)} tasks...")
+
+    start = time.perf_counter()
+    data = build_matrices(
+        tasks, descriptions.analyze_test_code, test_labels.generate_test_label,
+        req_names, label_names,
+    )
+    built = time.perf_counter()
+    report = summarize(data, req_names, label_names, top=args.top)
+    done = time.perf_counter()
+
+    print_report(report, top=args.top)
+    print(f"\n⏱  Rules + matrices: {built - start:.2f}s, aggregations: {done - built:.2f}s")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,10 @@ Generate meaningful task descriptions based on test requirements
 """
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=None)
 def analyze_test_code(test_code, test_id):
     """Analyze test code and return a human-readable requirement"""
 
@@ -173,6 +175,12 @@ def generate_task_description(task):
     else:
         return f"Complete the following requirements: {', '.join(unique_reqs)}."
 
+def update_descriptions(tasks):
+    """Replace every task description with one generated from its tests"""
+    for task in tasks:
+        task['description'] = generate_task_description(task)
+    return tasks
+
 def main():
     # Load tasks
     tasks_path = Path(__file__).parent.parent / 'apps' / 'web' / 'data' / 'tasks.levels.json'
@@ -183,15 +191,13 @@ def main():
     print(f"Processing {len(tasks)} tasks...")
 
     # Generate descriptions
-    for i, task in enumerate(tasks, 1):
-        old_desc = task['description']
-        new_desc = generate_task_description(task)
-        task['description'] = new_desc
-
-        if i <= 5:  # Show first 5 as examples
-            print(f"\n{task['id']}:")
-            print(f"  Old: {old_desc}")
-            print(f"  New: {new_desc}")
+    old_descs = [task['description'] for task in tasks[:5]]
+    update_descriptions(tasks)
+
+    for task, old_desc in zip(tasks, old_descs):  # Show first 5 as examples
+        print(f"\n{task['id']}:")
+        print(f"  Old: {old_desc}")
+        print(f"  New: {task['description']}")
 
     # Save enhanced tasks
     with open(tasks_path, 'w') as f:
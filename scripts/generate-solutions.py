@@ -337,6 +337,12 @@ def generate_solution_for_task(task):
 
     return solution
 
+def add_solutions(tasks):
+    """Attach a generated solution to every task"""
+    for task in tasks:
+        task['solution'] = generate_solution_for_task(task)
+    return tasks
+
 def main():
     # Load tasks
     tasks_path = Path(__file__).parent.parent / 'apps' / 'web' / 'data' / 'tasks.levels.json'
@@ -347,15 +353,14 @@ def main():
     print(f"Generating solutions for {len(tasks)} tasks...")
 
     # Generate solutions
-    for i, task in enumerate(tasks, 1):
-        solution = generate_solution_for_task(task)
-        task['solution'] = solution
-
-        if i <= 3:  # Show first 3 as examples
-            print(f"\n{task['id']}:")
-            print(f"  HTML: {len(solution['index.html'])} chars")
-            print(f"  CSS: {len(solution['style.css'])} chars")
-            print(f"  JS: {len(solution['script.js'])} chars")
+    add_solutions(tasks)
+
+    for task in tasks[:3]:  # Show first 3 as examples
+        solution = task['solution']
+        print(f"\n{task['id']}:")
+        print(f"  HTML: {len(solution['index.html'])} chars")
+        print(f"  CSS: {len(solution['style.css'])} chars")
+        print(f"  JS: {len(solution['script.js'])} chars")
 
     # Save enhanced tasks
     with open(tasks_path, 'w') as f:
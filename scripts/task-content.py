@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Run the task content generators from one entry point
+
+Each subcommand imports only the script it needs. With --batch, jobs are read
+from stdin (one "command input [output]" per line) and run in a single warm
+process, so rule tables and their caches are loaded once and shared.
+
+Usage:
+    python3 scripts/task-content.py labels
+    python3 scripts/task-content.py descriptions data/tasks.json -o out.json
+    python3 scripts/task-content.py --batch < jobs.txt
+"""
+import os
+import sys
+
+TASKS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', 'apps', 'web', 'data', 'tasks.levels.json')
+
+# Subcommand -> (script file, function applied to the task list)
+COMMANDS = {
+    'labels': ('add-test-labels.py', 'add_labels'),
+    'descriptions': ('generate-descriptions.py', 'update_descriptions'),
+    'solutions': ('generate-solutions.py', 'add_solutions'),
+}
+
+_loaded = {}
+
+
+def load_command(name):
+    """Import the script behind a subcommand on first use and return its function"""
+    if name not in COMMANDS:
+        raise ValueError(f"unknown command '{name}' (expected one of: {', '.join(COMMANDS)})")
+    if name not in _loaded:
+        # importlib.machinery is already loaded at interpreter start-up, unlike importlib.util
+        import types
+        from importlib.machinery import SourceFileLoader
+
+        filename, func_name = COMMANDS[name]
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        loader = SourceFileLoader(filename[:-3].replace('-', '_'), path)
+        module = types.ModuleType(loader.name)
+        module.__file__ = path
+        loader.exec_module(module)
+        _loaded[name] = getattr(module, func_name)
+    return _loaded[name]
+
+
+def run_job(name, input_path, output_path=None):
+    """Load tasks, apply one generator and save them (in place by default)"""
+    import json
+
+    func = load_command(name)
+    with open(input_path, 'r') as f:
+        tasks = json.load(f)
+
+    func(tasks)
+
+    with open(output_path or input_path, 'w') as f:
+        json.dump(tasks, f, indent=2)
+    return len(tasks)
+
+
+def run_batch(lines):
+    """Run every job listed in `lines`; return the number of failed jobs"""
+    import shlex
+    import time
+
+    failed = 0
+    start = time.perf_counter()
+    jobs = 0
+    for lineno, line in enumerate(lines, 1):
+        parts = shlex.split(line, comments=True)
+        if not parts:
+            continue
+        jobs += 1
+        if len(parts) not in (2, 3):
+            print(f"❌ line {lineno}: expected 'command input [output]', got {line.strip()!r}",
+                  file=sys.stderr)
+            failed += 1
+            continue
+        try:
+            count = run_job(*parts)
+        except Exception as e:
+            print(f"❌ line {lineno}: {parts[0]} {parts[1]}: {e}", file=sys.stderr)
+            failed += 1
+        else:
+            print(f"✓ {parts[0]}: {count} tasks -> {parts[-1]}")
+
+    print(f"\n{'✅' if not failed else '⚠️ '} {jobs - failed}/{jobs} jobs succeeded "
+          f"in {time.perf_counter() - start:.2f}s")
+    return failed
+
+
+def main(argv=None):
+    # Arguments are parsed by hand: importing argparse would double the start-up time
+    args = sys.argv[1:] if argv is None else list(argv)
+    usage = __doc__.strip()
+
+    if not args or args[0] in ('-h', '--help'):
+        print(usage)
+        return 0 if args else 2
+
+    if args == ['--batch']:
+        return 1 if run_batch(sys.stdin) else 0
+
+    output = None
+    if len(args) >= 2 and args[-2] in ('-o', '--output'):
+        output = args[-1]
+        args = args[:-2]
+
+    if not args or args[0] not in COMMANDS or len(args) > 2:
+        print(usage, file=sys.stderr)
+        return 2
+
+    command, input_path = args[0], (args[1] if len(args) == 2 else TASKS_PATH)
+    count = run_job(command, input_path, output)
+    print(f"✅ {command}: {count} tasks -> {output or input_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())